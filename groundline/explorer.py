@@ -388,8 +388,9 @@ class Explorer(VBox):
         search_term = change['new']
         search_term = rf'{search_term}'
         try:
+            pattern = re.compile(search_term, re.IGNORECASE)
             filtered_options = [name for name in self.name_selector.unfiltered_options
-                              if re.search(search_term, name, re.IGNORECASE)]
+                              if pattern.search(name)]
             self.name_selector.options = filtered_options
         except Exception as e:
             print(f"Error occurred while searching: {e}")
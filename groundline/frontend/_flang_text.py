@@ -1,20 +1,13 @@
 import re
+import sys
 from pathlib import Path
 
 def level(line):
     """
     Determine the level of indentation based on the number of leading |.
     """
-    res = 0
-    for c in line:
-        if c == '|':
-            res += 1
-        elif c == ' ':
-            continue
-        else:
-            break
-
-    return res
+    # the indentation is the leading run of '|' and ' '; lstrip finds its end
+    return line[:len(line) - len(line.lstrip("| "))].count("|")
 
 
 # ---------------------------------------------------------------------------
@@ -58,6 +51,33 @@ def unparse_text(line):
     return m.group(1) if m else None
 
 
+def name_value(line):
+    """The identifier of the first ``Name = '...'`` leaf on *line*, or None.
+
+    A find-and-slice rather than a regex: the dump always prints a Name's value
+    quoted, so the closing quote delimits it. The result is interned: the same
+    few identifiers recur throughout a dump.
+    """
+    start = line.find("Name = '")
+    if start < 0:
+        return None
+    start += 8
+    end = line.find("'", start)
+    if end <= start:
+        return None
+    return sys.intern(line[start:end])
+
+
+def head_node(line):
+    """The first node kind on a dump line, ignoring indentation and the rest of the chain.
+
+    ``| | ExecutionPartConstruct -> ExecutableConstruct -> ActionStmt -> CallStmt``
+    gives ``ExecutionPartConstruct``. The parse passes dispatch their line
+    handlers on it.
+    """
+    return line.lstrip("| ").partition(" ")[0]
+
+
 # ---------------------------------------------------------------------------
 # Reading sema's resolution out of an unparse annotation
 # ---------------------------------------------------------------------------
@@ -107,7 +127,9 @@ def call_candidates(text):
             for m in _CALL_SITE_RE.finditer(blanked)]
 
 
-_fortran_intrinsics = {
+# Lowercase names of Fortran intrinsic procedures (and intrinsic-module
+# procedures); function references to these are not recorded as calls.
+FORTRAN_INTRINSICS = frozenset({
     "abs", "aimag", "aint", "anint", "ceiling", "conjg", "dble",
     "floor", "int", "real", "nint", "mod", "modulo", "sign",
 
@@ -204,7 +226,4 @@ _fortran_intrinsics = {
     "ieee_support_intrinsic",
     "ieee_support_state",
 
-}
-
-def is_fortran_intrinsic(name):
-    return name.lower() in _fortran_intrinsics
\ No newline at end of file
+})
@@ -1,10 +1,20 @@
+import sys
 from abc import ABC, abstractmethod
+from collections import defaultdict
 
 class Node(ABC):
-    """Base class for all nodes in the parse tree representation."""
+    """Base class for all nodes in the parse tree representation.
+
+    Nodes and their subclasses declare ``__slots__``: a forest holds many of
+    them, and every attribute is assigned in ``__init__``.
+    """
+    __slots__ = ("name", "name_lower")
 
     def __init__(self, name):
-        self.name = name
+        # interned, so name lookups against captured identifiers compare by identity
+        self.name = sys.intern(name)
+        # Fortran names are case-insensitive; lowered once for the comparisons
+        self.name_lower = sys.intern(name.lower())
     
     def __str__(self):
         return self.name
@@ -24,15 +34,21 @@ class Scope(Node):
     ----------
     name : str
         The name of the scope.
-    used_names_lists : dict
+    used_names_lists : defaultdict
         A dictionary where keys are module objects and values are lists of names used from the module.
-    used_renames_lists : dict
+        Indexing a module not yet USE'd creates its (empty) list.
+    used_renames_lists : defaultdict
         A dictionary where keys are module objects and values are lists of (alias, name) tuples
+    wildcard_uses : set
+        The module objects USE'd without an only-list (every public name is visible).
     """
+    __slots__ = ("used_names_lists", "used_renames_lists", "wildcard_uses")
+
     def __init__(self, name):
         super().__init__(name)
-        self.used_names_lists = {} # Keys are module objects and values are lists of names used from the module
-        self.used_renames_lists = {} # Keys are module objects and values are lists of (alias, name) tuples
+        self.used_names_lists = defaultdict(list) # Keys are module objects and values are lists of names used from the module
+        self.used_renames_lists = defaultdict(list) # Keys are module objects and values are lists of (alias, name) tuples
+        self.wildcard_uses = set() # Module objects USE'd without an only-list
 
     @property
     def used_module_names(self):
@@ -63,8 +79,17 @@ class ProgramUnit(Scope):
     access_overrides : dict
         Per-name accessibility from explicit `public :: x` / `private :: x`
         statements, as name (lowercase) -> 'public' | 'private'.
+    named_entities : dict
+        Name -> the subroutine, function or interface defined here under that
+        name (see add_named).
+    routines_by_name : dict
+        Lowercased name -> the subroutine or function defined here under that
+        name (see add_named).
     """
 
+    __slots__ = ("subroutines", "functions", "interfaces", "derived_types", "parse_tree_path",
+                 "default_access", "access_overrides", "named_entities", "routines_by_name")
+
     def __init__(self, name):
         super().__init__(name)
         self.subroutines = set()
@@ -74,6 +99,26 @@ class ProgramUnit(Scope):
         self.parse_tree_path = None # To be set when the parse tree is read
         self.default_access = "public"
         self.access_overrides = {}
+        self.named_entities = {}
+        self.routines_by_name = {}
+
+    def add_named(self, node):
+        """Adds a subroutine, function or interface to this unit and to its name indexes.
+
+        A generic interface may share its name with one of the unit's routines;
+        named_entities then keeps the routine, whichever was added first.
+        """
+        if isinstance(node, Subroutine):
+            self.subroutines.add(node)
+            self.routines_by_name.setdefault(node.name_lower, node)
+        elif isinstance(node, Function):
+            self.functions.add(node)
+            self.routines_by_name.setdefault(node.name_lower, node)
+        else:
+            self.interfaces.add(node)
+            if node.name in self.named_entities:
+                return
+        self.named_entities[node.name] = node
 
     @classmethod
     def key(cls, name):
@@ -81,15 +126,15 @@ class ProgramUnit(Scope):
 
 class Module(ProgramUnit):
     """Class representing a Fortran module."""
-    pass
+    __slots__ = ()
 
 class Program(ProgramUnit):
     """Class representing a Fortran program."""
-    pass
+    __slots__ = ()
 
 class Subprogram(ProgramUnit):
     """Class representing a Fortran subprogram, i.e., a source file with no module or program statement."""
-    pass
+    __slots__ = ()
 
 class Callable(Scope):
     """Base class for subroutines and functions.
@@ -120,6 +165,9 @@ class Callable(Scope):
         List of argument names in order (e.g., ['data', 'len', 'pelist']).
         None if not yet parsed. Used for keyword argument matching.
     """
+    __slots__ = ("program_unit", "parent", "derived_types", "num_required_args",
+                 "arg_types", "arg_ranks", "arg_kinds", "arg_names")
+
     def __init__(self, name, program_unit, parent=None):
         """Initializes a Callable instance.
 
@@ -157,18 +205,20 @@ class Callable(Scope):
 
 class Subroutine(Callable):
     """Class representing a Fortran subroutine."""
-    pass
+    __slots__ = ()
 
 class Function(Callable):
     """Class representing a Fortran function."""
-    pass
+    __slots__ = ()
 
 class Interface(Node):
     """Class representing a Fortran interface block."""
+    __slots__ = ("program_unit", "procedures")
+
     def __init__(self, name, program_unit):
         super().__init__(name)
         self.program_unit = program_unit
-        self.program_unit.interfaces.add(self)
+        self.program_unit.add_named(self)
         self.procedures = set()
 
     @classmethod
@@ -177,6 +227,8 @@ class Interface(Node):
 
 class DerivedType(Node):
     """Class representing a Fortran derived type."""
+    __slots__ = ("scope", "bindings", "generic_bindings", "parent_type_name")
+
     def __init__(self, name, scope):
         super().__init__(name)
         assert hasattr(scope, 'derived_types'), self.msg("Current scope cannot hold derived types")
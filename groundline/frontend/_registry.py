@@ -18,13 +18,15 @@ class NodeRegistry:
         self._store = {}
 
     def _get_or_create(self, cls, *args, **kwargs):
+        store = self._store.get(cls)
+        if store is None:
+            store = self._store[cls] = {}
         key = cls.key(*args, **kwargs)
-        if cls not in self._store:
-            self._store[cls] = {}
-        if key not in self._store[cls]:
+        node = store.get(key)
+        if node is None:
             assert isinstance(key, str), f"Expected key to be str, got {type(key)}"
-            self._store[cls][key] = cls(*args, **kwargs)
-        return self._store[cls][key]
+            node = store[key] = cls(*args, **kwargs)
+        return node
 
     def Module(self, *args, **kwargs) -> Module:
         return self._get_or_create(Module, *args, **kwargs)
@@ -74,3 +76,40 @@ class NodeRegistry:
     @property
     def derived_types(self):
         return self._store.get(DerivedType, {}).values()
+
+    def binding_index(self):
+        """Map (type_name_lower, binding_lower) to (impl_name, defining_scope).
+
+        Covers the specific bindings of every derived type in the registry; where
+        two types (or two bindings) collide case-insensitively, the first one
+        registered wins.
+        """
+        index = {}
+        for dt in self.derived_types:
+            for bname, iname in dt.bindings.items():
+                index.setdefault((dt.name_lower, bname.lower()), (iname, dt.scope))
+        return index
+
+    def procedures_by_name(self):
+        """Map (is_function, lowercased name) to the procedures of that flavour
+        and name, in registration order."""
+        by_name = {}
+        for sub in self.subroutines:
+            by_name.setdefault((False, sub.name_lower), []).append(sub)
+        for fn in self.functions:
+            by_name.setdefault((True, fn.name_lower), []).append(fn)
+        return by_name
+
+    def modules_by_name(self):
+        """Map each lowercased module name to its module; the first one registered wins."""
+        by_name = {}
+        for mod in self.modules:
+            by_name.setdefault(mod.name_lower, mod)
+        return by_name
+
+    def derived_types_by_name(self):
+        """Map each lowercased type name to its derived types, in registration order."""
+        by_name = {}
+        for dt in self.derived_types:
+            by_name.setdefault(dt.name_lower, []).append(dt)
+        return by_name
@@ -1,10 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VariableInfo:
     """Information about a declared variable's type, rank, and kind.
+
+    Frozen, so that one instance can stand for every variable sharing the same
+    (type, rank, kind) — see ``ParseTree._variable_info``.
     
     Attributes
     ----------
@@ -15,7 +18,14 @@ class VariableInfo:
         Array rank: 0 for scalar, 1+ for arrays.
     kind : str or None
         Kind specifier (e.g., 'r8_kind', 'i4_kind') or None if unknown.
+    derived_type_name : str or None
+        The type name out of a 'derived:typename' type, or None for any other type.
     """
     type: str  # 'integer', 'real', 'logical', 'character', 'derived', 'unknown'
     rank: int = 0  # 0 for scalar, 1 for 1D array, etc.
     kind: Optional[str] = None  # Optional kind specifier
+    derived_type_name: Optional[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        name = self.type[len("derived:"):] if self.type.startswith("derived:") else None
+        object.__setattr__(self, "derived_type_name", name)
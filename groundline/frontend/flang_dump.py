@@ -1,13 +1,15 @@
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 from groundline.frontend._flang_text import (
-    level, is_fortran_intrinsic, node_path, unparse_text, call_candidates, demangle,
+    level, FORTRAN_INTRINSICS, node_path, unparse_text, head_node, name_value,
+    call_candidates, demangle,
 )
 from groundline.frontend._state import ParseState
 from groundline.frontend._variable_info import VariableInfo
-from groundline.frontend._nodes import Interface, Callable, DerivedType
+from groundline.frontend._nodes import Interface, Callable, DerivedType, Function
 from groundline.frontend._registry import NodeRegistry
 from groundline.ir import (
     IR, Entity, Signature, Use, FileError,
@@ -16,6 +18,53 @@ from groundline.ir import (
 )
 
 
+# Patterns matched against parse-tree lines, compiled once at import. Fixed
+# needles with no capture are plain substring tests at the call site instead.
+_BARE_NAME_RE = re.compile(r"\| Name = '\w+'")
+# An array-spec node and, for the counted forms (`DeferredShapeSpecList -> int
+# = '2'`), its dimension count; _ARRAY_SPEC_RANKS gives the rank otherwise.
+_ARRAY_SPEC_RE = re.compile(
+    r"(DeferredShapeSpecList|AssumedShapeSpec|AssumedRankSpec|ImpliedShapeSpec|ExplicitShapeSpec)"
+    r"( -> int = (?:'(\d+)')?)?"
+)
+_ARRAY_SPEC_RANKS = {
+    "DeferredShapeSpecList": None,  # uncounted: not a rank we can read here
+    "AssumedShapeSpec": 1,   # at least 1 assumed-shape dimension (e.g., array(lo:))
+    "AssumedRankSpec": -1,   # assumed rank (..) - could be any rank
+    "ImpliedShapeSpec": 1,   # implied shape (*) means assumed-size array
+    "ExplicitShapeSpec": 1,  # at least 1 dimension, caller may need to count more
+}
+_END_ROUTINE_NAME_RE = re.compile(r"End(?:Function|Subroutine)Stmt -> Name = '(\w+)'")
+# one scan tells the four Only forms apart; the match's lastgroup names the form
+_ONLY_RE = re.compile(
+    r"Only -> (?:GenericSpec -> (?:Name = '(?P<name>\w+)'"
+    r"|DefinedOperator -> IntrinsicOperator = (?P<operator>\w+)"
+    r"|(?P<assignment>Assignment))"
+    r"|(?P<rename>Rename -> Names))"
+)
+_ACCESS_KIND_RE = re.compile(r"AccessSpec -> Kind = (\w+)")
+_ACCESS_ID_NAME_RE = re.compile(r"AccessId -> GenericSpec -> Name = '(\w+)'")
+_EXTENDS_NAME_RE = re.compile(r"TypeAttrSpec -> Extends -> Name = '(\w+)'")
+_END_TYPE_NAME_RE = re.compile(r"EndTypeStmt -> Name = '(\w+)'")
+_MODULE_NAME_RE = re.compile(r"ModuleStmt -> Name = '(\w+)'")
+_END_MODULE_NAME_RE = re.compile(r"EndModuleStmt -> Name = '(\w+)'")
+_PROGRAM_NAME_RE = re.compile(r"ProgramStmt -> Name = '(\w+)'")
+_INTERFACE_NAME_RE = re.compile(r"InterfaceStmt -> GenericSpec -> Name = '(\w+)'")
+# a line inside an interface block: the ProcedureStmt's Kind, or a member's Name
+_INTERFACE_MEMBER_RE = re.compile(r"Kind = (?P<kind>\w+)|Name = '(?P<name>\w+)'")
+_PROC_DESIGNATOR_NAME_RE = re.compile(r"ProcedureDesignator -> Name = '(\w+)'")
+_INTRINSIC_TYPE_SPEC = "IntrinsicTypeSpec -> "
+# what follows _INTRINSIC_TYPE_SPEC on a declaration line, by prefix, in order
+_INTRINSIC_TYPE_PREFIXES = (
+    ("IntegerTypeSpec", "integer"),
+    ("Real", "real"),            # also RealTypeSpec
+    ("DoublePrecision", "real"),
+    ("Character", "character"),
+    ("Logical", "logical"),
+    ("Complex", "complex"),
+)
+
+
 # Confidence strata (D3). Frontend-internal tokens; the IR expresses them as the
 # calls_resolved / calls_assumed / calls_unresolved relations.
 RESOLVED = "resolved"
@@ -23,7 +72,7 @@ ASSUMED = "assumed"
 UNRESOLVED = "unresolved"
 
 
-@dataclass
+@dataclass(slots=True)
 class CallEvent:
     """One call site, as recorded during the call pass (resolution happens later).
 
@@ -42,7 +91,7 @@ class CallEvent:
     bound_type_name: Optional[str] = None  # declared derived type of `obj`, if known
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnknownTarget:
     """A call target that exists (it is called) but was found nowhere (D3).
 
@@ -70,13 +119,17 @@ class ParseTree:
         # A registry to intern node objects
         self.nr = node_registry or NodeRegistry()
 
-        # Internal iterator over lines in the parse tree file
-        self._lines_generator = None 
+        # The parse tree file, read whole on first use and kept until
+        # clear_cache, the nesting level of each of its lines (computed
+        # alongside), and the index of the current line in it (-1 before the
+        # first read). FlangDumpFrontend drops the lines after every pass, so
+        # only one file is held at a time across a forest.
+        self._all_lines = None
+        self._all_levels = None
+        self._idx = -1
 
-        # Current line being parsed
+        # Current line being parsed (its 1-based number is line_number)
         self.line = None
-        self.next_line = None
-        self.line_number = 0
 
         # Call sites recorded by the call pass, resolved later (classify_calls).
         self.call_events = []
@@ -90,44 +143,107 @@ class ParseTree:
         # Persists across parsing passes; survives Phase 2 to give `obj%binding()`
         # calls the declared derived type of `obj`.
         self.variables = {}
+        # one shared VariableInfo per distinct (type, rank, kind)
+        self._variable_infos = {}
+
+        # find_named_entity results by (origin, name), misses included. Only
+        # valid while the forest is unchanged, hence cleared by reset(), by
+        # parse_interface_stmt and at the start of each classify_calls run.
+        self._lookup_cache = {}
+
+        # (type_name_lower, binding_lower) -> (impl_name, defining_scope),
+        # type_name_lower -> [DerivedType], (is_function, name_lower) ->
+        # [procedure] and name_lower -> Module, built from the registry on first
+        # use in a classify_calls run (the forest is final by then).
+        self._binding_index = None
+        self._types_by_name = None
+        self._procs_by_name = None
+        self._modules_by_name = None
 
         # Current state variables during parsing that get updated as we read lines
         self.curr = ParseState()
 
-    def lines(self):
-        """Iterator over lines in the parse tree file."""
-        if self._lines_generator is None:
-            def _iter_lines():
-                with self.parse_tree_path.open('r') as f:
-                    self.next_line = f.readline().strip()
-                    for line in f:
-                        self.line = self.next_line
-                        self.next_line = line.strip()
-                        self.line_number += 1
-                        yield self.line
-                    self.line = self.next_line
-                    self.next_line = None
-                    yield self.line
-            self._lines_generator = _iter_lines()
-        return self._lines_generator
+    def _load_lines(self, text=None):
+        """Reads the whole parse tree file into a list of lines (once).
+
+        *text* is the file's contents when the caller has already read them
+        (see parse_header). Only trailing whitespace is trimmed: the dump indents
+        with ``| `` and never with leading blanks, but some nodes end in ``-> ``
+        and the matchers test line endings. rstrip hands back the line itself
+        when there is nothing to trim, so most lines are not copied. Each line's
+        level is computed here too, once for all three passes (see line_level
+        and peek_next_level).
+        """
+        if self._all_lines is None:
+            if text is None:
+                text = self.parse_tree_path.read_text()
+            # split on "\n" only, as iterating the file did: str.splitlines would
+            # also break on \x0b, \x0c, \x85, \u2028, ... inside a quoted literal
+            lines = text.split("\n")
+            if not lines[-1]:
+                lines.pop()  # the final newline ends the last line
+            self._all_lines = list(map(str.rstrip, lines))
+            self._all_levels = list(map(level, self._all_lines))
+        return self._all_lines
 
     def read_next_line(self):
         """Reads the next line from the parse tree file and updates self.line."""
-        next(self.lines())
+        all_lines = self._all_lines or self._load_lines()
+        if self._idx + 1 >= len(all_lines):
+            raise StopIteration
+        self._idx += 1
+        self.line = all_lines[self._idx]
         return self.line
-    
+
     def peek_next_line(self):
-        """Peeks at the next line without advancing the iterator."""
-        return self.next_line
-    
+        """Peeks at the next line without advancing the cursor."""
+        all_lines = self._all_lines or self._load_lines()
+        if self._idx + 1 < len(all_lines):
+            return all_lines[self._idx + 1]
+        return None
+
+    def peek_next_level(self):
+        """The level of the next line without advancing the cursor; -1 at EOF."""
+        if self._all_lines is None:
+            self._load_lines()
+        levels = self._all_levels
+        if self._idx + 1 < len(levels):
+            return levels[self._idx + 1]
+        return -1
+
     def reset(self):
-        """Resets the internal state for re-parsing the file."""
-        self._lines_generator = None
+        """Resets the internal state for re-parsing the file.
+
+        The file's lines stay cached, so the next pass does not read it again
+        (see clear_cache).
+        """
+        self._idx = -1
         self.line = None
-        self.next_line = None
-        self.line_number = 0
         self.curr = ParseState()
         self._expr_stack = []
+        self._lookup_cache = {}
+
+    @property
+    def line_level(self):
+        """The level of the current line; -1 before the first read."""
+        if self._idx < 0:
+            return -1
+        return self._all_levels[self._idx]
+
+    @property
+    def line_number(self):
+        """1-based number of the current line (0 before the first read)."""
+        return self._idx + 1
+
+    def clear_cache(self):
+        """Drops the cached lines; the next pass reads the file afresh.
+
+        The cursor is rewound with them, since it indexes the dropped lines.
+        """
+        self._all_lines = None
+        self._all_levels = None
+        self._idx = -1
+        self.line = None
 
     # -------------------------------------------------------------------------
     # Variable tracking methods
@@ -135,57 +251,72 @@ class ParseTree:
 
     def add_variable(self, name: str, var_info):
         """Register a variable in the current scope."""
-        scope_key = self.curr.get_scope_key()
-        if scope_key not in self.variables:
-            self.variables[scope_key] = {}
-        self.variables[scope_key][name.lower()] = var_info
+        self.variables.setdefault(self.curr.get_scope_key(), {})[sys.intern(name.lower())] = var_info
+
+    def _variable_info(self, var_type, rank, kind):
+        """The shared VariableInfo for (var_type, rank, kind); few distinct triples recur."""
+        key = (var_type, rank, kind)
+        info = self._variable_infos.get(key)
+        if info is None:
+            info = self._variable_infos[key] = VariableInfo(type=var_type, rank=rank, kind=kind)
+        return info
 
     def get_variable(self, name: str):
         """Look up a variable, checking current scope then enclosing scopes."""
         name_lower = name.lower()
-        
-        # Check current routine scope
+        variables = self.variables
+
+        # Check current routine scope, then the parent routine's (for nested routines)
         if self.curr.routine:
-            scope_key = self.curr.get_scope_key()
-            if scope_key in self.variables and name_lower in self.variables[scope_key]:
-                return self.variables[scope_key][name_lower]
-            
-            # Check parent routine scope (for nested routines)
+            found = variables.get(self.curr.get_scope_key(), {}).get(name_lower)
+            if found is not None:
+                return found
             if self.curr.parent_routine:
                 parent_scope = f"{self.curr.program_unit.name}::{self.curr.parent_routine.name}"
-                if parent_scope in self.variables and name_lower in self.variables[parent_scope]:
-                    return self.variables[parent_scope][name_lower]
-        
+                found = variables.get(parent_scope, {}).get(name_lower)
+                if found is not None:
+                    return found
+
         # Check module/program scope
         if self.curr.program_unit:
-            module_scope = self.curr.program_unit.name
-            if module_scope in self.variables and name_lower in self.variables[module_scope]:
-                return self.variables[module_scope][name_lower]
-        
+            return variables.get(self.curr.program_unit.name, {}).get(name_lower)
+
         return None
 
     # -------------------------------------------------------------------------
     # Helper methods for parsing array specs, kinds, and type compatibility
     # -------------------------------------------------------------------------
 
-    def _parse_array_spec(self, line):
-        """Parse array specification from a line and return rank (int or None)."""
-
-        if "DeferredShapeSpecList -> int = " in line:
-            m = re.search(r"DeferredShapeSpecList -> int = '(\d+)'", line)
-            return int(m.group(1)) if m else 1
-        if "AssumedShapeSpec -> int = " in line:
-            m = re.search(r"AssumedShapeSpec -> int = '(\d+)'", line)
-            return int(m.group(1)) if m else 1
-        if "AssumedShapeSpec" in line:
-            return 1  # At least 1 assumed-shape dimension (e.g., array(lo:))
-        if "AssumedRankSpec" in line:
-            return -1  # Assumed rank (..) - could be any rank
-        if "ImpliedShapeSpec" in line:
-            return 1  # Implied shape (*) means assumed-size array
-        if "ExplicitShapeSpec" in line:
-            return 1  # At least 1 dimension, caller may need to count more
-        return None
+    def _read_array_spec(self, rank):
+        """Consume the next (ArraySpec) line and its dimension lines; return the rank.
+
+        *rank* is replaced by the rank the spec line gives, if it gives one, then
+        grows by one per further ExplicitShapeSpec/AssumedShapeSpec line at the
+        spec's level. Child lines deeper than that (e.g. SpecificationExpr
+        bounds) are skipped.
+        """
+        m = _ARRAY_SPEC_RE.search(self.read_next_line())
+        if m is None:
+            return rank
+        spec, counted, count = m.groups()
+        if counted:
+            rank = int(count) if count else 1
+        elif _ARRAY_SPEC_RANKS[spec] is not None:
+            rank = _ARRAY_SPEC_RANKS[spec]
+        if spec != "ExplicitShapeSpec" and spec != "AssumedShapeSpec":
+            return rank
+
+        spec_level = self.line_level
+        while (nxt := self.peek_next_line()):
+            nxt_level = self.peek_next_level()
+            if nxt_level > spec_level:
+                self.read_next_line()
+            elif nxt_level == spec_level and ("ExplicitShapeSpec" in nxt or "AssumedShapeSpec" in nxt):
+                rank += 1
+                self.read_next_line()
+            else:
+                break
+        return rank
 
     def _kind_selector_name(self, line):
         """Extract the kind name from a KindSelector line (e.g. 'r8_kind'), or None.
@@ -201,17 +332,16 @@ class ParseTree:
         """
         if "KindSelector" not in line:
             return None
-        m = re.search(r"Name = '(\w+)'", line)
-        if m:
-            return m.group(1)
+        name = name_value(line)
+        if name:
+            return name
         if not node_path(line).endswith("Expr"):
             return None
         child = self.peek_next_line()
-        if child is None or level(child) <= level(line):
+        if child is None or self.peek_next_level() <= self.line_level:
             return None
         self.read_next_line()
-        m = re.search(r"Name = '(\w+)'", child)
-        return m.group(1) if m else None
+        return name_value(child)
 
     def _extract_structure_component_name(self, designator_level):
         """Extract the method name and object name from a ProcComponentRef -> StructureComponent.
@@ -238,27 +368,24 @@ class ParseTree:
         object_name = None
         found_dataref = False
 
-        while self.peek_next_line():
-            next_line = self.peek_next_line()
-            next_lvl = level(next_line)
+        while (next_line := self.peek_next_line()):
+            next_lvl = self.peek_next_level()
 
             if next_lvl <= designator_level:
                 break
 
             if next_lvl == designator_level + 1:
-                m = re.search(r"Name = '(\w+)'", next_line)
-                if m:
+                name = name_value(next_line)
+                if name:
                     if 'DataRef' in next_line and object_name is None:
                         # DataRef -> Name = 'obj_name' (simple case)
-                        object_name = m.group(1)
-                    callee_name = m.group(1)
+                        object_name = name
+                    callee_name = name
                 elif 'DataRef' in next_line:
                     found_dataref = True
             elif next_lvl == designator_level + 2 and found_dataref and object_name is None:
                 # Nested DataRef: the first Name child is the root object
-                m = re.search(r"Name = '(\w+)'", next_line)
-                if m:
-                    object_name = m.group(1)
+                object_name = name_value(next_line) or object_name
 
             self.read_next_line()
 
@@ -291,16 +418,10 @@ class ParseTree:
             the scope that defines the derived type. If no matching binding
             is found, returns (binding_name, None).
         """
-        binding_lower = binding_name.lower()
-        type_name_lower = type_name.lower()
-
-        for dt in self.nr.derived_types:
-            if dt.name.lower() == type_name_lower:
-                for bname, iname in dt.bindings.items():
-                    if bname.lower() == binding_lower:
-                        return iname, dt.scope
-
-        return binding_name, None
+        if self._binding_index is None:
+            self._binding_index = self.nr.binding_index()
+        return self._binding_index.get((type_name.lower(), binding_name.lower()),
+                                       (binding_name, None))
 
     def _record_call(self, written_name, call_text, is_function=False,
                      is_type_bound=False, object_name=None):
@@ -308,11 +429,11 @@ class ParseTree:
         bound_type_name = None
         if is_type_bound and object_name:
             var_info = self.get_variable(object_name)
-            if var_info and var_info.type.startswith("derived:"):
-                bound_type_name = var_info.type[len("derived:"):]
+            if var_info:
+                bound_type_name = var_info.derived_type_name
         self.call_events.append(CallEvent(
             caller=self.curr.scope,
-            written_name=written_name,
+            written_name=sys.intern(written_name),
             call_text=call_text,
             is_function=is_function,
             is_type_bound=is_type_bound,
@@ -326,7 +447,7 @@ class ParseTree:
         function reference nested in another call's argument list is not recorded
         as a call site of its own (an under-approximation; see DESIGN W2).
         """
-        while self.peek_next_line() and level(self.peek_next_line()) > call_level:
+        while self.peek_next_level() > call_level:
             self.read_next_line()
 
     def msg(self, prefix):
@@ -337,12 +458,24 @@ class ParseTree:
             f"  line: {self.line}"
 
     def parse_header(self):
-        """Parses the header of the parse tree file to ensure it is valid."""
+        """Parses the header of the parse tree file to ensure it is valid.
+
+        When nothing is cached yet, only the header line is read before the
+        check; the rest of the file is read from the same handle once it passes,
+        so a file that fails is skipped without being read whole.
+        """
         assert self.line is None, self.msg("parse_header should be called at the beginning before reading any lines.")
-        first = next(self.lines())
+        if self._all_lines is None:
+            with self.parse_tree_path.open() as f:
+                first = f.readline()
+                if first.startswith("======"):
+                    self._load_lines(first + f.read())
+        else:
+            first = self._all_lines[0] if self._all_lines else ""
         if not first.startswith("======"):
             print(f"Warning: Skipping {self.parse_tree_path.name} as it does not start with proper header.")
             return False
+        self.read_next_line()
         return True
 
     def parse_routine_begin(self):
@@ -353,29 +486,24 @@ class ParseTree:
 
         # advance to Name line, skipping Prefix blocks
         self.read_next_line()
-        stmt_level = level(self.line)
-        while re.search(r"\bPrefix", self.line) or level(self.line) > stmt_level:
+        stmt_level = self.line_level
+        while "Prefix" in self.line or self.line_level > stmt_level:
             self.read_next_line()
-        res = re.search(r"Name = '(\w+)'", self.line)
-        if not res:
+        name = name_value(self.line)
+        if not name:
             raise ValueError(self.msg("FunctionStmt syntax not recognized"))
-        name = res.group(1)
 
         # Collect dummy argument names following the routine name
         # For subroutines: DummyArg -> Name = 'xxx'
         # For functions: Name = 'xxx' at the same level as function name
         arg_names = []
-        while self.peek_next_line() and level(self.peek_next_line()) == stmt_level:
-            next_line = self.peek_next_line()
+        while (next_line := self.peek_next_line()) and self.peek_next_level() == stmt_level:
             if is_subroutine and "DummyArg -> Name = " in next_line:
-                m = re.search(r"Name = '(\w+)'", next_line)
-                if m:
-                    arg_names.append(m.group(1))
+                if (arg_name := name_value(next_line)):
+                    arg_names.append(arg_name)
                 self.read_next_line()
-            elif is_function and re.search(r"\| Name = '\w+'", next_line):
-                m = re.search(r"Name = '(\w+)'", next_line)
-                if m:
-                    arg_names.append(m.group(1))
+            elif is_function and _BARE_NAME_RE.search(next_line):
+                arg_names.append(name_value(next_line))
                 self.read_next_line()
             else:
                 break
@@ -390,12 +518,12 @@ class ParseTree:
             routine = self.nr.Function(name, self.curr.program_unit, self.curr.parent_routine)
             self.curr.routine = routine
             if self.curr.parent_routine is None:
-                self.curr.program_unit.functions.add(routine)
+                self.curr.program_unit.add_named(routine)
         else:
             routine = self.nr.Subroutine(name, self.curr.program_unit, self.curr.parent_routine)
             self.curr.routine = routine
             if self.curr.parent_routine is None:
-                self.curr.program_unit.subroutines.add(routine)
+                self.curr.program_unit.add_named(routine)
         
         # Parse SpecificationPart to get optional arguments and types
         self._parse_routine_signature(routine, arg_names)
@@ -415,53 +543,22 @@ class ParseTree:
         str
             The type name (e.g., 'integer', 'real', 'character', 'logical', 'derived:typename')
         """
-        if "IntrinsicTypeSpec -> IntegerTypeSpec" in decl_line:
-            return "integer"
-        if "IntrinsicTypeSpec -> RealTypeSpec" in decl_line or "IntrinsicTypeSpec -> Real" in decl_line:
-            return "real"
-        if "IntrinsicTypeSpec -> DoublePrecision" in decl_line:
-            return "real"
-        if "IntrinsicTypeSpec -> Character" in decl_line:
-            return "character"
-        if "IntrinsicTypeSpec -> Logical" in decl_line:
-            return "logical"
-        if "IntrinsicTypeSpec -> Complex" in decl_line:
-            return "complex"
+        i = decl_line.find(_INTRINSIC_TYPE_SPEC)
+        if i >= 0:
+            spec = decl_line[i + len(_INTRINSIC_TYPE_SPEC):]
+            for prefix, type_name in _INTRINSIC_TYPE_PREFIXES:
+                if spec.startswith(prefix):
+                    return type_name
         if "DeclarationTypeSpec -> Type" in decl_line or "DerivedTypeSpec" in decl_line:
             # Derived type - extract name if possible
-            m = re.search(r"Name = '(\w+)'", decl_line)
-            if m:
-                return f"derived:{m.group(1)}"
+            type_name = name_value(decl_line)
+            if type_name:
+                return f"derived:{type_name}"
             return "derived"
         if "DeclarationTypeSpec -> Class" in decl_line:
             return "class"
         return "unknown"
 
-    def _count_explicit_dimensions(self, first_line):
-        """Count additional dimension specifications after the first.
-
-        Handles ExplicitShapeSpec, AssumedShapeSpec, and DeferredShapeSpecList
-        continuation lines that follow the initial ArraySpec line.
-        Skips child lines (e.g., SpecificationExpr) that are deeper than the
-        array spec level.
-        """
-        count = 0
-        if "ExplicitShapeSpec" in first_line or "AssumedShapeSpec" in first_line:
-            spec_level = level(first_line)
-            while self.peek_next_line():
-                nxt = self.peek_next_line()
-                nxt_level = level(nxt)
-                if nxt_level > spec_level:
-                    # Skip child lines (e.g., SpecificationExpr bounds)
-                    self.read_next_line()
-                    continue
-                if nxt_level == spec_level and ("ExplicitShapeSpec" in nxt or "AssumedShapeSpec" in nxt):
-                    count += 1
-                    self.read_next_line()
-                else:
-                    break
-        return count
-
     def _parse_entity_decl(self, base_rank):
         """Parse an EntityDecl block and return (name, rank) or (None, 0) if not found.
         
@@ -470,24 +567,18 @@ class ParseTree:
         base_rank : int
             The default rank from the type declaration (used if no ArraySpec in entity).
         """
-        entity_level = level(self.line)
+        entity_level = self.line_level
         entity_name = None
         entity_rank = 0
         
-        while self.peek_next_line() and level(self.peek_next_line()) > entity_level:
+        while self.peek_next_level() > entity_level:
             entity_line = self.peek_next_line()
             
             if "Name = '" in entity_line:
-                m = re.search(r"Name = '(\w+)'", entity_line)
-                if m:
-                    entity_name = m.group(1)
+                entity_name = name_value(entity_line) or entity_name
                 self.read_next_line()
             elif "ArraySpec" in entity_line:
-                rank = self._parse_array_spec(entity_line)
-                if rank is not None:
-                    entity_rank = rank
-                self.read_next_line()
-                entity_rank += self._count_explicit_dimensions(entity_line)
+                entity_rank = self._read_array_spec(entity_rank)
             else:
                 self.read_next_line()
         
@@ -509,7 +600,7 @@ class ParseTree:
             return
             
         # Look for SpecificationPart
-        if not self.peek_next_line() or "| SpecificationPart" not in self.peek_next_line():
+        if not (nxt := self.peek_next_line()) or "| SpecificationPart" not in nxt:
             n = len(arg_names)
             routine.arg_names = list(arg_names)  # Store names even if types unknown
             routine.arg_types = ["unknown"] * n
@@ -519,13 +610,10 @@ class ParseTree:
             return
             
         self.read_next_line()  # consume SpecificationPart line
-        spec_level = level(self.line)
+        spec_level = self.line_level
         
         # Track argument info
-        optional_args = set()
-        arg_type_map = {}
-        arg_rank_map = {}
-        arg_kind_map = {}
+        arg_info_map = {}  # arg name -> (type, rank, kind, is_optional)
         
         # Current declaration state
         decl_type = "unknown"
@@ -533,10 +621,9 @@ class ParseTree:
         decl_rank = 0
         decl_kind = None
         
-        while self.peek_next_line():
-            next_line = self.peek_next_line()
+        while (next_line := self.peek_next_line()):
             
-            if level(next_line) <= spec_level:
+            if self.peek_next_level() <= spec_level:
                 break
             
             # New TypeDeclarationStmt - reset state
@@ -553,12 +640,12 @@ class ParseTree:
                 decl_type = self._extract_type_from_decl(next_line)
                 if decl_type in ("derived", "class"):
                     self.read_next_line()
-                    if self.peek_next_line() and "DerivedTypeSpec" in self.peek_next_line():
+                    if (nxt := self.peek_next_line()) and "DerivedTypeSpec" in nxt:
                         self.read_next_line()
-                        if self.peek_next_line() and "Name = " in self.peek_next_line():
-                            m = re.search(r"Name = '(\w+)'", self.read_next_line())
-                            if m:
-                                decl_type = f"derived:{m.group(1)}"
+                        if (nxt := self.peek_next_line()) and "Name = " in nxt:
+                            type_name = name_value(self.read_next_line())
+                            if type_name:
+                                decl_type = f"derived:{type_name}"
                     continue
                 self.read_next_line()
                 decl_kind = self._kind_selector_name(next_line) or decl_kind
@@ -579,11 +666,7 @@ class ParseTree:
             
             # Array specification (type-level rank)
             if "AttrSpec -> ArraySpec" in next_line:
-                rank = self._parse_array_spec(next_line)
-                if rank is not None:
-                    decl_rank = rank
-                self.read_next_line()
-                decl_rank += self._count_explicit_dimensions(next_line)
+                decl_rank = self._read_array_spec(decl_rank)
                 continue
                 
             # EntityDecl - extract variable name and entity-level rank
@@ -592,45 +675,48 @@ class ParseTree:
                 decl_name, entity_rank = self._parse_entity_decl(decl_rank)
                 
                 if decl_name:
-                    self.add_variable(decl_name, VariableInfo(type=decl_type, rank=entity_rank, kind=decl_kind))
+                    self.add_variable(decl_name, self._variable_info(decl_type, entity_rank, decl_kind))
                     if decl_name in arg_names:
-                        arg_type_map[decl_name] = decl_type
-                        arg_rank_map[decl_name] = entity_rank
-                        arg_kind_map[decl_name] = decl_kind
-                        if decl_is_optional:
-                            optional_args.add(decl_name)
+                        arg_info_map[decl_name] = (decl_type, entity_rank, decl_kind, decl_is_optional)
                 continue
             
             self.read_next_line()
         
         # Build ordered lists based on arg_names order
         routine.arg_names = list(arg_names)  # Store the argument names for keyword matching
-        routine.arg_types = [arg_type_map.get(name, "unknown") for name in arg_names]
-        routine.arg_ranks = [arg_rank_map.get(name, 0) for name in arg_names]
-        routine.arg_kinds = [arg_kind_map.get(name, None) for name in arg_names]
-        routine.num_required_args = routine.num_args - len(optional_args)
+        infos = [arg_info_map.get(name, ("unknown", 0, None, False)) for name in arg_names]
+        routine.arg_types, routine.arg_ranks, routine.arg_kinds, optional = map(list, zip(*infos))
+        routine.num_required_args = routine.num_args - sum(optional)
 
     def parse_routine_end(self):
+        # one cheap scan rejects almost every line before the two specific ones
+        if "| End" not in self.line:
+            return False
         if "| EndFunctionStmt" in self.line:
-            assert self.curr.in_function, self.msg("EndFunctionStmt found without a preceding FunctionStmt")
-            m = re.search(r"EndFunctionStmt -> Name = '(\w+)'", self.line)
-            if m:
-                end_name = m.group(1)
-                assert end_name == self.curr.routine.name, self.msg(f"EndFunctionStmt name {end_name} does not match FunctionStmt name {self.curr.routine.name}")
-            self.curr.routine = self.curr.parent_routine
-            self.curr.parent_routine = None
-            return True
+            stmt, begin_stmt, in_routine = "EndFunctionStmt", "FunctionStmt", self.curr.in_function
+        elif "| EndSubroutineStmt" in self.line:
+            stmt, begin_stmt, in_routine = "EndSubroutineStmt", "SubroutineStmt", self.curr.in_subroutine
+        else:
+            return False
+        assert in_routine, self.msg(f"{stmt} found without a preceding {begin_stmt}")
+        m = _END_ROUTINE_NAME_RE.search(self.line)
+        if m:
+            end_name = m.group(1)
+            assert end_name == self.curr.routine.name, self.msg(f"{stmt} name {end_name} does not match {begin_stmt} name {self.curr.routine.name}")
+        self.curr.routine = self.curr.parent_routine
+        self.curr.parent_routine = None
+        return True
 
-        if "| EndSubroutineStmt" in self.line:
-            assert self.curr.in_subroutine, self.msg("EndSubroutineStmt found without a preceding SubroutineStmt")
-            m = re.search(r"EndSubroutineStmt -> Name = '(\w+)'", self.line)
-            if m:
-                end_name = m.group(1)
-                assert end_name == self.curr.routine.name, self.msg(f"EndSubroutineStmt name {end_name} does not match Subroparse_subroutine_call_stmtutineStmt name {self.curr.routine.name}")
-            self.curr.routine = self.curr.parent_routine
-            self.curr.parent_routine = None
-            return True
-        return False
+    def _read_next_name(self, error):
+        """Advances to the next line and returns its ``Name = '...'`` value, interned.
+
+        Rename lists put the local alias and the original name on the two lines
+        after the ``Rename -> Names`` node; both are read through here.
+        """
+        self.line = self.read_next_line()
+        name = name_value(self.line)
+        assert name, self.msg(error)
+        return name
 
     def parse_only_clause(self):
         if "| Only" not in self.line:
@@ -638,37 +724,29 @@ class ParseTree:
 
         used_name = None
         used_name_alias = None # for rename clauses
-        if (m := re.search(r"Only -> GenericSpec -> Name = '(\w+)'", self.line)):
-            used_name = m.group(1)
-        elif (m := re.search(r"Only -> GenericSpec -> DefinedOperator -> IntrinsicOperator = (\w+)", self.line)):
-            used_name = m.group(1)
-        elif re.search(r"Only -> GenericSpec -> Assignment", self.line):
+        m = _ONLY_RE.search(self.line)
+        form = m.lastgroup if m else None
+        if form == "name" or form == "operator":
+            used_name = sys.intern(m.group(form))
+        elif form == "assignment":
             used_name = "assignment(=)"
-        elif re.search(r"Only -> Rename -> Names", self.line):
-            self.line = self.read_next_line()
-            m = re.search(r"Name = '(\w+)'", self.line)
-            assert m, self.msg("Only Rename syntax not recognized")
-            used_name_alias = m.group(1)
-            self.line = self.read_next_line()
-            m = re.search(r"Name = '(\w+)'", self.line)
-            assert m, self.msg("Only Rename syntax not recognized")
-            used_name = m.group(1)
+        elif form == "rename":
+            used_name_alias = self._read_next_name("Only Rename syntax not recognized")
+            used_name = self._read_next_name("Only Rename syntax not recognized")
         else:
             raise ValueError(self.msg("Only syntax not recognized"))
 
-        assert self.curr.used_module, self.msg("Only clause found without a preceding UseStmt")
+        used_module = self.curr.used_module
+        assert used_module, self.msg("Only clause found without a preceding UseStmt")
+        scope = self.curr.scope
 
         if used_name_alias:
             # It's a rename in an Only clause
-            used_renames = self.curr.scope.used_renames_lists[self.curr.used_module]
-            used_renames.append((used_name_alias, used_name))
+            scope.used_renames_lists[used_module].append((used_name_alias, used_name))
         else:
             # Regular only clause
-            used_names = self.curr.scope.used_names_lists[self.curr.used_module]
-            if used_names and used_names[0] == '*':
-                pass
-            else:
-                used_names.append(used_name)
+            if used_module not in scope.wildcard_uses:
+                scope.used_names_lists[used_module].append(used_name)
 
         return True
 
@@ -677,19 +755,13 @@ class ParseTree:
             return False
         
         assert self.line.endswith("Rename -> Names"), self.msg("Rename syntax not recognized")
-        assert self.curr.used_module, self.msg("Rename clause found without a preceding UseStmt")
+        used_module = self.curr.used_module
+        assert used_module, self.msg("Rename clause found without a preceding UseStmt")
 
-        self.line = self.read_next_line()
-        m = re.search(r"Name = '(\w+)'", self.line)
-        assert m, self.msg("Rename syntax not recognized")
-        used_name_alias = m.group(1)
-        self.line = self.read_next_line()
-        m = re.search(r"Name = '(\w+)'", self.line)
-        assert m, self.msg("Rename syntax not recognized")
-        used_name = m.group(1)
+        used_name_alias = self._read_next_name("Rename syntax not recognized")
+        used_name = self._read_next_name("Rename syntax not recognized")
 
-        used_renames = self.curr.scope.used_renames_lists[self.curr.used_module]
-        used_renames.append((used_name_alias, used_name))
+        self.curr.scope.used_renames_lists[used_module].append((used_name_alias, used_name))
 
         if "| Rename" not in self.peek_next_line():
             self.curr.used_module = None
@@ -699,30 +771,30 @@ class ParseTree:
     def parse_use_stmt(self):
         if "| UseStmt" not in self.line:
             return False
-        m = re.search(r"UseStmt *$", self.line)
-        assert m, self.msg("UseStmt syntax not recognized")
+        assert self.line.endswith("UseStmt"), self.msg("UseStmt syntax not recognized")
         self.line = self.read_next_line()
-        if re.search(r"\bModuleNature", self.line):
+        if "ModuleNature" in self.line:
             self.line = self.read_next_line()
-        m = re.search(r"Name = '(\w+)'", self.line)
-        assert m, self.msg("UseStmt Name syntax not recognized")
-        used_module_name = m.group(1)
+        used_module_name = name_value(self.line)
+        assert used_module_name, self.msg("UseStmt Name syntax not recognized")
         self.curr.used_module = self.nr.Module(used_module_name)
         next_line = self.peek_next_line()
         assert next_line is not None, self.msg("Unexpected end of file after UseStmt")
-        if "| Only" in next_line:
-            if self.curr.used_module not in self.curr.scope.used_names_lists:
-                self.curr.scope.used_names_lists[self.curr.used_module] = []
-            if self.curr.used_module not in self.curr.scope.used_renames_lists:
-                self.curr.scope.used_renames_lists[self.curr.used_module] = []
-        elif "| Rename" in next_line:
-            if self.curr.used_module not in self.curr.scope.used_names_lists:
-                self.curr.scope.used_names_lists[self.curr.used_module] = ['*']
-            if self.curr.used_module not in self.curr.scope.used_renames_lists:
-                self.curr.scope.used_renames_lists[self.curr.used_module] = []
-        else:
-            self.curr.scope.used_names_lists[self.curr.used_module] = ['*']
-            self.curr.scope.used_renames_lists[self.curr.used_module] = []
+
+        scope = self.curr.scope
+        used_module = self.curr.used_module
+        first_use = used_module not in scope.used_names_lists
+        # indexing creates the module's empty lists on its first USE (see Scope)
+        used_names = scope.used_names_lists[used_module]
+        used_renames = scope.used_renames_lists[used_module]
+        if "| Rename" in next_line:
+            # `use m, a => b` still makes all of m's public names visible
+            if first_use:
+                scope.wildcard_uses.add(used_module)
+        elif "| Only" not in next_line:
+            used_names.clear()
+            used_renames.clear()
+            scope.wildcard_uses.add(used_module)
             self.curr.used_module = None
 
         return True
@@ -744,14 +816,14 @@ class ParseTree:
         if not node_path(self.line).endswith("AccessStmt"):
             return False
 
-        stmt_level = level(self.line)
+        stmt_level = self.line_level
         kind = None
         names = []
-        while self.peek_next_line() and level(self.peek_next_line()) > stmt_level:
+        while self.peek_next_level() > stmt_level:
             child = self.read_next_line()
-            if (m := re.search(r"AccessSpec -> Kind = (\w+)", child)):
+            if (m := _ACCESS_KIND_RE.search(child)):
                 kind = m.group(1).lower()
-            elif (m := re.search(r"AccessId -> GenericSpec -> Name = '(\w+)'", child)):
+            elif (m := _ACCESS_ID_NAME_RE.search(child)):
                 names.append(m.group(1))
 
         unit = self.curr.program_unit
@@ -778,14 +850,13 @@ class ParseTree:
         # Check for EXTENDS and other TypeAttrSpec
         parent_type_name = None
         while "| TypeAttrSpec" in self.line:
-            m = re.search(r"TypeAttrSpec -> Extends -> Name = '(\w+)'", self.line)
+            m = _EXTENDS_NAME_RE.search(self.line)
             if m:
                 parent_type_name = m.group(1)
             self.read_next_line()
 
-        m = re.search(r"Name = '(\w+)'", self.line)
-        assert m, self.msg("DerivedTypeStmt Name syntax not recognized")
-        derived_type_name = m.group(1)
+        derived_type_name = name_value(self.line)
+        assert derived_type_name, self.msg("DerivedTypeStmt Name syntax not recognized")
         self.curr.derived_type = self.nr.DerivedType(derived_type_name, self.curr.scope)
         if parent_type_name:
             self.curr.derived_type.parent_type_name = parent_type_name
@@ -795,7 +866,7 @@ class ParseTree:
         if "| EndTypeStmt" not in self.line:
             return False
         assert self.curr.in_derived_type, self.msg("EndTypeStmt found without a preceding DerivedTypeStmt")
-        m = re.search(r"EndTypeStmt -> Name = '(\w+)'", self.line)
+        m = _END_TYPE_NAME_RE.search(self.line)
         if m:
             end_type_name = m.group(1)
             assert end_type_name == self.curr.derived_type.name, self.msg(f"EndTypeStmt name {end_type_name} does not match DerivedTypeStmt name {self.curr.derived_type.name}")
@@ -832,7 +903,7 @@ class ParseTree:
         if not self.curr.in_derived_type:
             return False
 
-        binding_level = level(self.line)
+        binding_level = self.line_level
         is_generic = "TypeBoundGenericStmt" in self.line
         dt = self.curr.derived_type
 
@@ -846,9 +917,8 @@ class ParseTree:
                 # first name is the binding; the second (from `=>`) its impl
                 dt.bindings[decl_names[0]] = decl_names[1] if len(decl_names) > 1 else decl_names[0]
 
-        while self.peek_next_line():
-            next_line = self.peek_next_line()
-            if level(next_line) <= binding_level:
+        while (next_line := self.peek_next_line()):
+            if self.peek_next_level() <= binding_level:
                 break
             self.read_next_line()
 
@@ -857,16 +927,16 @@ class ParseTree:
                 decl_names = []
                 in_decl = True
                 continue
-            m = re.search(r"Name = '(\w+)'", next_line)
-            if not m:
+            name = name_value(next_line)
+            if not name:
                 continue
             if is_generic:
                 if "GenericSpec" in next_line:
-                    generic_name = m.group(1)
+                    generic_name = name
                 else:
-                    specifics.append(m.group(1))
+                    specifics.append(name)
             elif in_decl:
-                decl_names.append(m.group(1))
+                decl_names.append(name)
             # names outside any decl (e.g. WithInterface's interface name) are
             # not bindings — ignore them
 
@@ -885,12 +955,12 @@ class ParseTree:
         if self.curr.in_derived_type:
             return False
         
-        stmt_level = level(self.line)
+        stmt_level = self.line_level
         var_type = "unknown"
         var_rank = 0
         var_kind = None
         
-        while self.peek_next_line() and level(self.peek_next_line()) > stmt_level:
+        while self.peek_next_level() > stmt_level:
             next_line = self.peek_next_line()
             
             # Extract type from DeclarationTypeSpec
@@ -901,32 +971,28 @@ class ParseTree:
                     # `type(t) :: x` / `class(t) :: x` split over child lines:
                     # DerivedTypeSpec, then Name — read them so the declared type
                     # is usable for resolving `x%binding()` calls.
-                    if self.peek_next_line() and "DerivedTypeSpec" in self.peek_next_line():
+                    if (nxt := self.peek_next_line()) and "DerivedTypeSpec" in nxt:
                         self.read_next_line()
-                        if self.peek_next_line() and "Name = " in self.peek_next_line():
-                            m = re.search(r"Name = '(\w+)'", self.read_next_line())
-                            if m:
-                                var_type = f"derived:{m.group(1)}"
+                        if (nxt := self.peek_next_line()) and "Name = " in nxt:
+                            type_name = name_value(self.read_next_line())
+                            if type_name:
+                                var_type = f"derived:{type_name}"
                     continue
                 var_kind = self._kind_selector_name(next_line) or var_kind
             # Array rank in AttrSpec
             elif "AttrSpec -> ArraySpec" in next_line:
-                rank = self._parse_array_spec(next_line)
-                if rank is not None:
-                    var_rank = rank
-                self.read_next_line()
-                var_rank += self._count_explicit_dimensions(next_line)
+                var_rank = self._read_array_spec(var_rank)
             # EntityDecl block
             elif "EntityDecl" in next_line and "Name = " not in next_line:
                 self.read_next_line()
                 entity_name, entity_rank = self._parse_entity_decl(var_rank)
                 if entity_name:
-                    self.add_variable(entity_name, VariableInfo(type=var_type, rank=entity_rank, kind=var_kind))
+                    self.add_variable(entity_name, self._variable_info(var_type, entity_rank, var_kind))
             # Direct name (inline EntityDecl)
             elif "Name = '" in next_line and "EntityDecl" not in self.line:
-                m = re.search(r"Name = '(\w+)'", next_line)
-                if m:
-                    self.add_variable(m.group(1), VariableInfo(type=var_type, rank=var_rank, kind=var_kind))
+                var_name = name_value(next_line)
+                if var_name:
+                    self.add_variable(var_name, self._variable_info(var_type, var_rank, var_kind))
                 self.read_next_line()
             else:
                 self.read_next_line()
@@ -936,7 +1002,7 @@ class ParseTree:
     def parse_module_stmt(self):
         if "| ModuleStmt" not in self.line:
             return False
-        m = re.search(r"ModuleStmt -> Name = '(\w+)'", self.line)
+        m = _MODULE_NAME_RE.search(self.line)
         assert m, self.msg("ModuleStmt syntax not recognized")
         assert self.curr.module is None, self.msg("ModuleStmt found without a preceding EndModuleStmt")
         module_name = m.group(1)
@@ -948,7 +1014,7 @@ class ParseTree:
         if "| EndModuleStmt" not in self.line:
             return False
         assert self.curr.module, self.msg("EndModuleStmt found without a preceding ModuleStmt")
-        m = re.search(r"EndModuleStmt -> Name = '(\w+)'", self.line)
+        m = _END_MODULE_NAME_RE.search(self.line)
         if m:
             end_module_name = m.group(1)
             assert end_module_name == self.curr.module.name, self.msg(f"EndModuleStmt name {end_module_name} does not match ModuleStmt name {self.curr.module.name}")
@@ -959,17 +1025,19 @@ class ParseTree:
         if not self.line.startswith("Program -> ProgramUnit"):
             return False
 
-        if self.line.startswith("Program -> ProgramUnit -> FunctionSubprogram") or \
-           self.line.startswith("Program -> ProgramUnit -> SubroutineSubprogram"):
+        # the unit kind is the node right after the prefix; branch on it once
+        kind = self.line[len("Program -> ProgramUnit -> "):].partition(" ")[0]
+
+        if kind == "FunctionSubprogram" or kind == "SubroutineSubprogram":
             self.curr.subprogram = self.nr.Subprogram(self.parse_tree_path.stem)
             return True
 
-        if self.line.startswith("Program -> ProgramUnit -> Module"):
+        if kind == "Module":
             return True  # handled by ModuleStmt/EndModuleStmt
 
-        if self.line.startswith("Program -> ProgramUnit -> MainProgram"):
+        if kind == "MainProgram":
             self.line = self.read_next_line()
-            m = re.search(r"ProgramStmt -> Name = '(\w+)'", self.line)
+            m = _PROGRAM_NAME_RE.search(self.line)
             if not m:
                 raise ValueError(self.msg("ProgramStmt syntax not recognized"))
             program_name = m.group(1)
@@ -993,13 +1061,15 @@ class ParseTree:
         if "Assignment" in self.line:
             return False # todo: assignment interface        
 
-        m = re.search(r"InterfaceStmt -> GenericSpec -> Name = '(\w+)'", self.line)
+        m = _INTERFACE_NAME_RE.search(self.line)
         assert m, self.msg("InterfaceStmt syntax not recognized")
         assert self.curr.program_unit is not None, self.msg("InterfaceStmt found outside of a program unit")
         assert self.curr.routine is None, self.msg("InterfaceStmt found within a routine, nested interfaces are not supported")
 
         interface_name = m.group(1)
         interface = self.nr.Interface(interface_name, self.curr.program_unit)
+        # a new interface can change what earlier lookups would now find
+        self._lookup_cache.clear()
 
         # Read until EndInterfaceStmt
         while self.line:
@@ -1008,14 +1078,15 @@ class ParseTree:
                 break
             if self.line.endswith("InterfaceSpecification -> ProcedureStmt"):
                 continue
-            if m := re.search(r"Kind = (\w+)", self.line):
-                kind = m.group(1)
+            m = _INTERFACE_MEMBER_RE.search(self.line)
+            if m and m.lastgroup == "kind":
+                kind = m.group("kind")
                 if kind == "Procedure":
                     return False # todo: handle these cases
                 assert kind == "ModuleProcedure", self.msg("Only ModuleProcedure kinds are supported in interface blocks")
                 continue
-            if m := re.search(r"Name = '(\w+)'", self.line):
-                procedure_name = m.group(1)
+            if m:
+                procedure_name = m.group("name")
                 procedure = self.find_named_entity(self.curr.program_unit, procedure_name)
                 assert procedure is not None, self.msg(f"Could not find module procedure '{procedure_name}' for interface '{interface_name}'")
                 interface.procedures.add(procedure)
@@ -1057,68 +1128,82 @@ class ParseTree:
         -------
         Node or None
             The found entity, or None if not found.
+
+        Results, misses included, are memoized per ``(origin, name)`` until the
+        next :meth:`reset` or until this tree registers a new interface.
         """
 
+        # node names are interned (see Node), so interning the probe lets the
+        # name-index and only-list comparisons below succeed on identity
+        name = sys.intern(name)
+        key = (origin, name)
+        if key in self._lookup_cache:
+            return self._lookup_cache[key]
+        found = self._lookup_cache[key] = self._walk_use_chain(origin, name)
+        return found
+
+    def _walk_use_chain(self, origin, name):
+        """The uncached search behind :meth:`find_named_entity`."""
+
         origin_unit = origin.program_unit if hasattr(origin, 'program_unit') else origin
 
         if origin_unit is None:
             print(f"Warning: origin_unit is None when searching for {name} from {origin}")
             raise ValueError("origin_unit is None")
 
-        visited = set() # to avoid repetition
+        # An explicit worklist rather than recursion, with each (scope, name)
+        # searched at most once per lookup: a base module reached along many USE
+        # paths is not re-walked once per path. Successors are pushed in reverse
+        # so they pop in priority order, i.e. the search stays depth-first with
+        # the first hit winning. Almost every step searches for the probe name
+        # itself, so those are marked by scope alone; only a rename's original
+        # name needs a (scope, name) pair.
+        probe = name
+        visited = set()
 
-        def dfs(scope, name):
+        # A routine scope's own USE statements are searched first, then the
+        # enclosing program unit's.
+        stack = [(origin_unit, name)]
+        if origin is not origin_unit:
+            stack.append((origin, name))
 
-            if (scope, name) in visited:
-                return None
-            visited.add((scope, name))
+        while stack:
+            scope, name = stack.pop()
+            mark = scope if name is probe else (scope, name)
+            if mark in visited:
+                continue
+            visited.add(mark)
 
             # Check the scope's own subprograms and interfaces. (A Callable scope
             # has none of these; its own USE statements below still apply.)
-            for subr in getattr(scope, "subroutines", ()):
-                if subr.name == name:
-                    return subr
-            for func in getattr(scope, "functions", ()):
-                if func.name == name:
-                    return func
-            for intf in getattr(scope, "interfaces", ()):
-                if intf.name == name:
-                    return intf
+            named = getattr(scope, "named_entities", None)
+            if named is not None and (found := named.get(name)) is not None:
+                return found
+
+            successors = []
 
             # Explicit only-list imports: flang already validated the import, so
             # the name's accessibility in used_mod is settled; search used_mod as
             # a fresh origin (its own privates are candidates there).
             for used_mod, names in scope.used_names_lists.items():
                 if name in names:
-                    result = dfs(used_mod, name)
-                    if result is not None:
-                        return result
+                    successors.append((used_mod, name))
 
             # Renamed imports: the alias is local; the original name is looked
             # up in the exporting module.
             for used_mod, renames in scope.used_renames_lists.items():
                 for alias, original_name in renames:
                     if alias == name:
-                        result = dfs(used_mod, original_name)
-                        if result is not None:
-                            return result
+                        successors.append((used_mod, original_name))
 
             # Wildcard imports: only names the used module exports are visible.
-            for used_mod, names in scope.used_names_lists.items():
-                if '*' in names and self._exports(used_mod, name):
-                    result = dfs(used_mod, name)
-                    if result is not None:
-                        return result
+            for used_mod in scope.used_names_lists:
+                if used_mod in scope.wildcard_uses and self._exports(used_mod, name):
+                    successors.append((used_mod, name))
 
-            return None
+            stack.extend(reversed(successors))
 
-        # A routine scope's own USE statements are searched first, then the
-        # enclosing program unit's.
-        if origin is not origin_unit:
-            result = dfs(origin, name)
-            if result is not None:
-                return result
-        return dfs(origin_unit, name)
+        return None
 
     def parse_subroutine_call_stmt(self):
 
@@ -1135,18 +1220,18 @@ class ParseTree:
 
         self.line = self.read_next_line()
         assert self.line.endswith("| Call"), self.msg("CallStmt syntax not recognized.")
-        call_level = level(self.line)
+        call_level = self.line_level
 
         self.line = self.read_next_line()
         if self.line.endswith("ProcedureDesignator -> ProcComponentRef -> Scalar -> StructureComponent"):
-            designator_level = level(self.line)
+            designator_level = self.line_level
             binding_name, object_name = self._extract_structure_component_name(designator_level)
             if binding_name is not None:
                 self._record_call(binding_name, call_text,
                                   is_type_bound=True, object_name=object_name)
             self._skip_call_block(call_level)
             return True
-        m = re.search(r"ProcedureDesignator -> Name = '(\w+)'", self.line)
+        m = _PROC_DESIGNATOR_NAME_RE.search(self.line)
         if not m:
             raise ValueError(self.msg("ProcedureDesignator syntax not recognized"))
         self._record_call(m.group(1), call_text)
@@ -1161,7 +1246,7 @@ class ParseTree:
             return False
 
         assert self.curr.program_unit is not None, self.msg("FunctionReference found outside of a program unit")
-        call_level = level(self.line)
+        call_level = self.line_level
 
         # The exact resolved text of *this* call is the annotation on the
         # enclosing Expr node (the FunctionReference's parent line), which
@@ -1174,27 +1259,26 @@ class ParseTree:
         callee_name = None
         is_type_bound = False
         object_name = None
-        m = re.search(r"ProcedureDesignator -> Name = '(\w+)'", self.line)
+        m = _PROC_DESIGNATOR_NAME_RE.search(self.line)
         if m:
             callee_name = m.group(1)
         elif "ProcComponentRef" in self.line:
-            designator_level = level(self.line)
+            designator_level = self.line_level
             callee_name, object_name = self._extract_structure_component_name(designator_level)
             if callee_name is None:
                 return True
             is_type_bound = True
         else:
-            l = level(self.line)
-            while level(self.line) >= l:
+            l = lvl = self.line_level
+            while lvl >= l:
                 self.line = self.read_next_line()
-                if level(self.line) == l+1 and '| Name = ' in self.line:
-                    m = re.search(r"Name = '(\w+)'", self.line)
-                    if m:
-                        callee_name = m.group(1)
+                lvl = self.line_level
+                if lvl == l+1 and '| Name = ' in self.line:
+                    callee_name = name_value(self.line)
                     break
             assert callee_name is not None, self.msg("FunctionReference syntax not recognized")
 
-        if is_fortran_intrinsic(callee_name):
+        if callee_name.lower() in FORTRAN_INTRINSICS:
             return True
 
         self._record_call(callee_name, call_text, is_function=True,
@@ -1202,39 +1286,74 @@ class ParseTree:
         self._skip_call_block(call_level)
         return True
 
+    # Per-pass line dispatch: the head node of a line (see head_node) selects the
+    # handlers that can possibly claim it, tried in the order the cascade used
+    # to try them. Each handler still checks its own line shape, so a head node
+    # shared by several statements (DeclarationConstruct) just lists them all.
+    _STRUCTURE_HANDLERS = {
+        "FunctionStmt": (parse_routine_begin,),
+        "SubroutineStmt": (parse_routine_begin,),
+        "EndFunctionStmt": (parse_routine_end,),
+        "EndSubroutineStmt": (parse_routine_end,),
+        "Only": (parse_only_clause,),
+        "Rename": (parse_rename_clause,),
+        "UseStmt": (parse_use_stmt,),
+        "DeclarationConstruct": (parse_access_stmt, parse_derived_type_stmt, parse_variable_declaration),
+        "TypeBoundProcBinding": (parse_type_bound_proc_binding,),
+        "EndTypeStmt": (parse_end_derived_type_stmt,),
+        "ModuleStmt": (parse_module_stmt,),
+        "EndModuleStmt": (parse_end_module_stmt,),
+        "Program": (parse_program_unit,),
+    }
+
+    _INTERFACE_HANDLERS = {
+        "FunctionStmt": (parse_routine_begin,),
+        "SubroutineStmt": (parse_routine_begin,),
+        "EndFunctionStmt": (parse_routine_end,),
+        "EndSubroutineStmt": (parse_routine_end,),
+        "DeclarationConstruct": (parse_derived_type_stmt,),
+        "TypeBoundProcBinding": (parse_type_bound_proc_binding,),
+        "EndTypeStmt": (parse_end_derived_type_stmt,),
+        "ModuleStmt": (parse_module_stmt,),
+        "EndModuleStmt": (parse_end_module_stmt,),
+        "Program": (parse_program_unit,),
+        "InterfaceStmt": (parse_interface_stmt,),
+    }
+
+    _CALL_HANDLERS = {
+        "FunctionStmt": (parse_routine_begin,),
+        "SubroutineStmt": (parse_routine_begin,),
+        "EndFunctionStmt": (parse_routine_end,),
+        "EndSubroutineStmt": (parse_routine_end,),
+        "DeclarationConstruct": (parse_derived_type_stmt,),
+        "EndTypeStmt": (parse_end_derived_type_stmt,),
+        "ModuleStmt": (parse_module_stmt,),
+        "EndModuleStmt": (parse_end_module_stmt,),
+        "Program": (parse_program_unit,),
+        # a block statement, or the action of an IfStmt
+        "ExecutionPartConstruct": (parse_subroutine_call_stmt,),
+        "ActionStmt": (parse_subroutine_call_stmt,),
+        "FunctionReference": (parse_function_call_stmt,),
+    }
+
     def parse_structure(self):
         """Reads a flang parse tree file and extracts structural information."""
 
         try:
-            self.parse_header()
-
-            for self.line in self.lines():
-                if self.parse_routine_begin():
-                    continue
-                if self.parse_routine_end():
-                    continue
-                if self.parse_only_clause():
-                    continue
-                if self.parse_rename_clause():
-                    continue
-                if self.parse_use_stmt():
-                    continue
-                if self.parse_access_stmt():
-                    continue
-                if self.parse_derived_type_stmt():
-                    continue
-                if self.parse_type_bound_proc_binding():
-                    continue
-                if self.parse_end_derived_type_stmt():
-                    continue
-                if self.parse_variable_declaration():
-                    continue
-                if self.parse_module_stmt():
-                    continue
-                if self.parse_end_module_stmt():
-                    continue
-                if self.parse_program_unit():
-                    continue
+            if not self.parse_header():
+                return
+
+            # the handler table is resolved once per pass, not once per line; the
+            # walk is a plain index loop, and handlers that consume lines advance
+            # the same cursor
+            lines = self._load_lines()
+            handlers = self._STRUCTURE_HANDLERS
+            while self._idx + 1 < len(lines):
+                self._idx += 1
+                self.line = lines[self._idx]
+                for handler in handlers.get(head_node(self.line), ()):
+                    if handler(self):
+                        break
 
         finally:
             self.reset()
@@ -1243,27 +1362,17 @@ class ParseTree:
         """Reads a flang parse tree file and extracts interface blocks."""
 
         try:
-            self.parse_header()
-
-            for self.line in self.lines():
-                if self.parse_routine_begin():
-                    continue
-                if self.parse_routine_end():
-                    continue
-                if self.parse_derived_type_stmt():
-                    continue
-                if self.parse_type_bound_proc_binding():
-                    continue
-                if self.parse_end_derived_type_stmt():
-                    continue
-                if self.parse_module_stmt():
-                    continue
-                if self.parse_end_module_stmt():
-                    continue
-                if self.parse_program_unit():
-                    continue
-                if self.parse_interface_stmt():
-                    continue
+            if not self.parse_header():
+                return
+
+            lines = self._load_lines()
+            handlers = self._INTERFACE_HANDLERS
+            while self._idx + 1 < len(lines):
+                self._idx += 1
+                self.line = lines[self._idx]
+                for handler in handlers.get(head_node(self.line), ()):
+                    if handler(self):
+                        break
         finally:
             self.reset()
 
@@ -1278,38 +1387,31 @@ class ParseTree:
         self.call_events = []
 
         try:
-            self.parse_header()
-
-            for self.line in self.lines():
+            if not self.parse_header():
+                return self.call_events
+
+            lines = self._load_lines()
+            levels = self._all_levels
+            handlers = self._CALL_HANDLERS
+            while self._idx + 1 < len(lines):
+                self._idx += 1
+                self.line = lines[self._idx]
                 # Maintain the stack of enclosing annotated Expr nodes: each Expr
                 # unparse is the exact resolved text of the (sub)expression it
                 # heads, which is how a FunctionReference reads its own call text.
-                lvl = level(self.line)
+                lvl = levels[self._idx]
                 while self._expr_stack and self._expr_stack[-1][0] >= lvl:
                     self._expr_stack.pop()
-                if node_path(self.line).endswith("Expr"):
+                # (the substring test spares the regex in node_path on the many
+                # lines that mention no Expr at all)
+                if "Expr" in self.line and node_path(self.line).endswith("Expr"):
                     text = unparse_text(self.line)
                     if text is not None:
                         self._expr_stack.append((lvl, text))
 
-                if self.parse_routine_begin():
-                    continue
-                if self.parse_routine_end():
-                    continue
-                if self.parse_derived_type_stmt():
-                    continue
-                if self.parse_end_derived_type_stmt():
-                    continue
-                if self.parse_module_stmt():
-                    continue
-                if self.parse_end_module_stmt():
-                    continue
-                if self.parse_program_unit():
-                    continue
-                if self.parse_subroutine_call_stmt():
-                    continue
-                if self.parse_function_call_stmt():
-                    continue
+                for handler in handlers.get(head_node(self.line), ()):
+                    if handler(self):
+                        break
             return self.call_events
         finally:
             self.reset()
@@ -1338,8 +1440,9 @@ class ParseTree:
             # Dynamic dispatch keeps the `%binding(` in the text; check it first
             # so an array-element object (`x(i)%go(...)`) can't masquerade as a
             # resolved call to `x`.
+            written_lower = event.written_name.lower()
             for _, is_bound, name in cands:
-                if is_bound and name.lower() == event.written_name.lower():
+                if is_bound and name.lower() == written_lower:
                     return ("dynamic", event.written_name)
             # Static dispatch: sema hoists the object into the argument list and
             # prints the specific up front: `CALL go_r(obj,1._4)`.
@@ -1357,23 +1460,25 @@ class ParseTree:
 
     def _procs_named(self, name, is_function):
         """All defined procedures of the right flavour with this name (any scope)."""
-        pool = self.nr.functions if is_function else self.nr.subroutines
-        return [p for p in pool if p.name.lower() == name.lower()]
+        if self._procs_by_name is None:
+            self._procs_by_name = self.nr.procedures_by_name()
+        return self._procs_by_name.get((is_function, name.lower()), [])
 
     @staticmethod
     def _proc_in_scope(scope, name, is_function):
         """A procedure named *name* among *scope*'s own subprograms, or None."""
-        pool = getattr(scope, "functions" if is_function else "subroutines", ())
-        for p in pool:
-            if p.name.lower() == name.lower():
-                return p
+        routines = getattr(scope, "routines_by_name", None)
+        if routines is None:
+            return None
+        p = routines.get(name.lower())
+        if p is not None and isinstance(p, Function) == is_function:
+            return p
         return None
 
     def _module_named(self, name):
-        for mod in self.nr.modules:
-            if mod.name.lower() == name.lower():
-                return mod
-        return None
+        if self._modules_by_name is None:
+            self._modules_by_name = self.nr.modules_by_name()
+        return self._modules_by_name.get(name.lower())
 
     @staticmethod
     def _use_chain_module(scope, name):
@@ -1385,17 +1490,18 @@ class ParseTree:
         wildcard USE pins nothing.
         """
         modules = set()
+        name_lower = name.lower()
         scopes = [scope]
         program_unit = getattr(scope, "program_unit", None)
         if program_unit is not None:
             scopes.append(program_unit)
         for s in scopes:
             for used_mod, names in getattr(s, "used_names_lists", {}).items():
-                if any(n != "*" and n.lower() == name.lower() for n in names):
+                if any(n.lower() == name_lower for n in names):
                     modules.add(used_mod.name)
             for used_mod, renames in getattr(s, "used_renames_lists", {}).items():
                 for alias, _ in renames:
-                    if alias.lower() == name.lower():
+                    if alias.lower() == name_lower:
                         modules.add(used_mod.name)
         return modules.pop() if len(modules) == 1 else None
 
@@ -1459,6 +1565,8 @@ class ParseTree:
         itself is searched up its EXTENDS chain (inherited bindings); a type's
         own binding shadows the parent's.
         """
+        if self._types_by_name is None:
+            self._types_by_name = self.nr.derived_types_by_name()
         binding_lower = binding_name.lower()
         seen = set()
         queue = [type_name.lower()]
@@ -1467,9 +1575,7 @@ class ParseTree:
             if tname in seen:
                 continue
             seen.add(tname)
-            for dt in self.nr.derived_types:
-                if dt.name.lower() != tname:
-                    continue
+            for dt in self._types_by_name.get(tname, ()):
                 found_here = False
                 for gname, members in dt.generic_bindings.items():
                     if gname.lower() == binding_lower:
@@ -1537,10 +1643,11 @@ class ParseTree:
             if mangled:
                 _, def_mod, specific = mangled
                 return self._edges_for_mangled(event, def_mod, specific, interface=iface)
+            name_lower, written_lower = name.lower(), written.lower()
             if iface is not None:
                 edges = [(RESOLVED, iface)]
                 member = next((p for p in iface.procedures
-                               if p.name.lower() == name.lower()), None)
+                               if p.name_lower == name_lower), None)
                 if member is not None:
                     edges.append((RESOLVED, member))
                 else:
@@ -1549,7 +1656,7 @@ class ParseTree:
                     edges += [(ASSUMED, p) for p in iface.procedures]
                 return edges
             if found is not None:
-                if name.lower() in (written.lower(), found.name.lower()):
+                if name_lower in (written_lower, found.name_lower):
                     return [(RESOLVED, found)]
                 # Sema picked something other than the visible procedure of that
                 # name (shouldn't happen; trust sema and try to locate it).
@@ -1558,7 +1665,7 @@ class ParseTree:
                     return [(RESOLVED, target)]
                 return [(UNRESOLVED, UnknownTarget(name, None, event.is_function))]
             # Nothing visible under the written name.
-            if name.lower() == written.lower():
+            if name_lower == written_lower:
                 # Sema echoes the name unchanged: an external / unparsed target.
                 module = self._use_chain_module(event.caller, written)
                 return [(UNRESOLVED, UnknownTarget(written, module, event.is_function))]
@@ -1587,6 +1694,11 @@ class ParseTree:
         whole forest.
         """
         edges = []
+        # the forest may have changed since the last run: start every cache
+        # built from it afresh
+        self._binding_index = self._types_by_name = None
+        self._procs_by_name = self._modules_by_name = None
+        self._lookup_cache.clear()
         for event in self.call_events:
             for stratum, target in self._classify_event(event):
                 edges.append((event.caller, stratum, target))
@@ -1650,8 +1762,12 @@ def _scope_uses(ir, scope_node, scope_id):
     """Project a scope's USE clauses onto IR `uses` edges."""
     names_lists = getattr(scope_node, "used_names_lists", {}) or {}
     renames_lists = getattr(scope_node, "used_renames_lists", {}) or {}
+    wildcard_uses = getattr(scope_node, "wildcard_uses", ())
     for used_module in set(names_lists) | set(renames_lists):
-        only = tuple(names_lists.get(used_module, []) or [])
+        if used_module in wildcard_uses:
+            only = ("*",)
+        else:
+            only = tuple(names_lists.get(used_module, []) or [])
         renames = tuple(tuple(r) for r in (renames_lists.get(used_module, []) or []))
         ir.uses.add(Use(scope=scope_id, module=used_module.name,
                         only=only, renames=renames))
@@ -1783,14 +1899,21 @@ class FlangDumpFrontend:
         trees = []
         file_errors = []
 
+        parsed = [ParseTree(path, registry) for path in paths]
+
+        # Each pass drops a tree's lines once it is done with the file: every
+        # pass visits the whole forest before the next starts, so keeping them
+        # would hold every dump in memory at once. A file is read once per pass.
+
         # Pass 1: structure (must complete for all files before cross-file resolution)
-        for path in paths:
-            tree = ParseTree(path, registry)
+        for tree in parsed:
             try:
                 tree.parse_structure()
             except Exception as e:  # fault isolation: skip the file, keep going
-                file_errors.append(FileError(path, f"parse_structure: {e}"))
+                file_errors.append(FileError(tree.parse_tree_path, f"parse_structure: {e}"))
                 continue
+            finally:
+                tree.clear_cache()
             trees.append(tree)
 
         # Pass 2: interfaces
@@ -1799,6 +1922,7 @@ class FlangDumpFrontend:
                 tree.parse_interfaces()
             except Exception as e:
                 file_errors.append(FileError(tree.parse_tree_path, f"parse_interfaces: {e}"))
+            tree.clear_cache()
 
         # Pass 3: record call sites
         for tree in trees:
@@ -1806,6 +1930,7 @@ class FlangDumpFrontend:
                 tree.parse_calls()
             except Exception as e:
                 file_errors.append(FileError(tree.parse_tree_path, f"parse_calls: {e}"))
+            tree.clear_cache()
 
         # Pass 4: classify each call site against the whole forest — sema's
         # unparse answer where it exists, scope-correct lookup otherwise —
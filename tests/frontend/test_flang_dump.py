@@ -12,7 +12,7 @@ from pathlib import Path
 
 from groundline.frontend.flang_dump import ParseTree
 from groundline.frontend._flang_text import (
-    node_path, unparse_text, demangle, call_candidates,
+    level, node_path, unparse_text, head_node, name_value, demangle, call_candidates,
 )
 from groundline.frontend._nodes import Subroutine
 from groundline.frontend._registry import NodeRegistry
@@ -21,13 +21,19 @@ from groundline.frontend._registry import NodeRegistry
 F90_DIR = Path(__file__).parent.parent / "f90"
 
 
-def parse_all_passes(ptree_path):
-    """Parse a single fixture through all recording passes; return (ParseTree, registry)."""
+def parse_all_passes(ptree_path, decls_only=False):
+    """Parse a single fixture through all recording passes; return (ParseTree, registry).
+
+    With *decls_only*, the call pass (the only one walking executable statements)
+    is skipped; enough for tests that read variables and interfaces.
+    """
+    assert ptree_path.exists(), f"Parse tree not found: {ptree_path}"
     nr = NodeRegistry()
     pt = ParseTree(ptree_path, node_registry=nr)
     pt.parse_structure()
     pt.parse_interfaces()
-    pt.parse_calls()
+    if not decls_only:
+        pt.parse_calls()
     return pt, nr
 
 
@@ -62,6 +68,67 @@ class TestSemaLineShapes:
         assert unparse_text(self.SEMA_CALL) == "CALL compute_real(r,1_4)"
         assert unparse_text(self.BARE_CALL) is None
 
+    def test_name_value(self):
+        assert name_value("| | DummyArg -> Name = 'flag'") == "flag"
+        assert name_value(self.SEMA_CALL) is None
+
+    def test_head_node(self):
+        assert head_node(self.SEMA_CALL) == "ActionStmt"
+        assert head_node("| | FunctionStmt") == "FunctionStmt"
+        assert head_node("Program -> ProgramUnit -> Module") == "Program"
+
+
+# =============================================================================
+# Reading the dump: line loading, the cursor and its cached levels
+# =============================================================================
+
+class TestParseTreeCursor:
+
+    def test_level(self):
+        assert level("| | | | ActionStmt -> CallStmt = 'CALL compute_real(r,1_4)'") == 4
+        assert level("Program -> ProgramUnit -> Module") == 0
+        assert level("| |  |x | y") == 3
+        assert level("") == 0
+
+    def test_cached_levels_follow_the_cursor(self):
+        pt = ParseTree(F90_DIR / "test_interface_basic_ptree")
+        first = pt.peek_next_level()
+        assert first == level(pt.read_next_line()) == pt.line_level
+        while pt.peek_next_line() is not None:
+            nxt = pt.peek_next_level()
+            assert nxt == level(pt.read_next_line()) == pt.line_level
+        assert pt.peek_next_level() == -1
+
+    def test_no_current_level_before_a_read(self):
+        pt = ParseTree(F90_DIR / "test_interface_basic_ptree")
+        assert pt.line_level == -1
+        pt.read_next_line()
+        pt.read_next_line()
+        pt.clear_cache()
+        assert pt.line_level == -1
+        assert pt.read_next_line().startswith("======")
+
+    def test_only_newline_ends_a_line(self, tmp_path):
+        # a form feed inside a character literal must not split the dump line
+        dump = tmp_path / "ff_ptree"
+        dump.write_text("======\n| | Expr = '\"a\x0cb\"'\n| | | Name = 'x'\n")
+        pt = ParseTree(dump)
+        assert pt.read_next_line() == "======"
+        assert pt.read_next_line() == "| | Expr = '\"a\x0cb\"'"
+        assert pt.line_level == 2
+        assert pt.read_next_line() == "| | | Name = 'x'"
+        assert pt.peek_next_line() is None
+
+    def test_file_without_header_is_skipped_unread(self, tmp_path):
+        dump = tmp_path / "no_header_ptree"
+        dump.write_text("Program -> ProgramUnit -> Module\n| ModuleStmt -> Name = 'm'\n")
+        nr = NodeRegistry()
+        pt = ParseTree(dump, node_registry=nr)
+        pt.parse_structure()
+        assert pt.parse_calls() == []
+        assert not list(nr.modules)
+        assert pt._all_lines is None
+
 
 # =============================================================================
 # Reading sema's resolution out of unparse text (Phase 2, DESIGN Q1/Q2)
@@ -167,9 +234,11 @@ class TestCallEvents:
 
 class TestVisibility:
 
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        self.pt, self.nr = parse_all_passes(F90_DIR / "test_private_specifics_ptree")
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def setup(cls):
+        # one parse per class: its tests only read the tree
+        cls.pt, cls.nr = parse_all_passes(F90_DIR / "test_private_specifics_ptree")
 
     def test_access_stmts_recorded(self):
         priv = get_module(self.nr, "priv_mod")
@@ -191,6 +260,60 @@ class TestVisibility:
         assert found is not None and found.name == "compute_r"
 
 
+class TestUseChainLookup:
+    """find_named_entity over a hand-built USE diamond: caller -> (left, right)
+    -> base, all wildcard USEs."""
+
+    def setup_method(self):
+        self.nr = NodeRegistry()
+        self.pt = ParseTree(F90_DIR / "test_interface_basic_ptree", node_registry=self.nr)
+        self.caller = self.nr.Module("caller_mod")
+        self.left = self.nr.Module("left_mod")
+        self.right = self.nr.Module("right_mod")
+        self.base = self.nr.Module("base_mod")
+        for scope, used in ((self.caller, self.left), (self.caller, self.right),
+                            (self.left, self.base), (self.right, self.base)):
+            scope.used_names_lists[used] = []
+            scope.used_renames_lists[used] = []
+            scope.wildcard_uses.add(used)
+
+    def _define(self, unit, name):
+        sub = self.nr.Subroutine(name, unit)
+        unit.add_named(sub)
+        return sub
+
+    def test_shared_base_is_reached_through_the_diamond(self):
+        shared = self._define(self.base, "shared")
+        assert self.pt.find_named_entity(self.caller, "shared") is shared
+
+    def test_first_use_wins(self):
+        # depth-first in USE order: left_mod (and its base) before right_mod
+        from_left = self._define(self.left, "dup")
+        self._define(self.right, "dup")
+        assert self.pt.find_named_entity(self.caller, "dup") is from_left
+
+    def test_missing_name(self):
+        assert self.pt.find_named_entity(self.caller, "nowhere") is None
+
+    def test_reset_drops_cached_lookups(self):
+        assert self.pt.find_named_entity(self.caller, "late") is None
+        late = self._define(self.base, "late")
+        self.pt.reset()
+        assert self.pt.find_named_entity(self.caller, "late") is late
+
+    def test_classify_calls_drops_cached_lookups(self):
+        assert self.pt.find_named_entity(self.caller, "late") is None
+        late = self._define(self.base, "late")
+        assert self.pt.classify_calls() == []
+        assert self.pt.find_named_entity(self.caller, "late") is late
+
+    def test_routine_shadows_same_named_interface(self):
+        iface = self.nr.Interface("dup", self.base)
+        sub = self._define(self.base, "dup")
+        assert iface in self.base.interfaces
+        assert self.pt.find_named_entity(self.caller, "dup") is sub
+
+
 class TestUseChainModule:
     """_use_chain_module scope-qualifies unresolved targets (hand-built registry,
     since a with-sema fixture cannot USE a module outside the parsed set)."""
@@ -206,7 +329,8 @@ class TestUseChainModule:
         assert ParseTree._use_chain_module(self.caller, "only_sub") == "ext_mod"
 
     def test_wildcard_pins_nothing(self):
-        self.caller_mod.used_names_lists[self.ext] = ["*"]
+        self.caller_mod.used_names_lists[self.ext] = []
+        self.caller_mod.wildcard_uses.add(self.ext)
         assert ParseTree._use_chain_module(self.caller, "only_sub") is None
 
     def test_rename_pins_through_the_alias(self):
@@ -215,17 +339,72 @@ class TestUseChainModule:
         assert ParseTree._use_chain_module(self.caller, "alias_sub") == "ext_mod"
 
 
+class TestBindingIndex:
+    """_resolve_binding_name reads a (type, binding) index built from the registry."""
+
+    def setup_method(self):
+        self.nr = NodeRegistry()
+        self.pt = ParseTree(F90_DIR / "test_interface_basic_ptree", node_registry=self.nr)
+        self.mod = self.nr.Module("shapes_mod")
+        self.nr.DerivedType("Box_T", self.mod).bindings["Reset"] = "reset_box"
+        self.nr.DerivedType("ball_t", self.mod).bindings["reset"] = "reset_ball"
+
+    def test_binding_is_resolved_on_the_declared_type(self):
+        assert self.pt._resolve_binding_name("RESET", "box_t") == ("reset_box", self.mod)
+        assert self.pt._resolve_binding_name("reset", "Ball_T") == ("reset_ball", self.mod)
+
+    def test_unknown_binding_falls_back_to_its_own_name(self):
+        assert self.pt._resolve_binding_name("grow", "box_t") == ("grow", None)
+
+    def test_index_is_rebuilt_per_classify_run(self):
+        self.pt._resolve_binding_name("reset", "box_t")
+        self.nr.DerivedType("cube_t", self.mod).bindings["reset"] = "reset_cube"
+        self.pt.classify_calls()
+        assert self.pt._resolve_binding_name("reset", "cube_t") == ("reset_cube", self.mod)
+
+
+class TestNameIndexes:
+    """Classification looks procedures and modules up by lowercased name."""
+
+    def setup_method(self):
+        self.nr = NodeRegistry()
+        self.pt = ParseTree(F90_DIR / "test_interface_basic_ptree", node_registry=self.nr)
+        self.mod = self.nr.Module("Grid_Mod")
+        self.sub = self.nr.Subroutine("Set_Grid", self.mod)
+        self.fn = self.nr.Function("grid_size", self.mod)
+        self.mod.add_named(self.sub)
+        self.mod.add_named(self.fn)
+
+    def test_routine_in_scope_by_flavour(self):
+        assert ParseTree._proc_in_scope(self.mod, "SET_GRID", False) is self.sub
+        assert ParseTree._proc_in_scope(self.mod, "set_grid", True) is None
+        assert ParseTree._proc_in_scope(self.mod, "Grid_Size", True) is self.fn
+
+    def test_module_and_procedures_across_the_forest(self):
+        other = self.nr.Module("other_mod")
+        twin = self.nr.Subroutine("set_grid", other)
+        assert self.pt._module_named("grid_mod") is self.mod
+        assert self.pt._procs_named("set_grid", False) == [self.sub, twin]
+        assert self.pt._procs_named("set_grid", True) == []
+
+    def test_indexes_are_rebuilt_per_classify_run(self):
+        assert self.pt._module_named("late_mod") is None
+        late = self.nr.Module("late_mod")
+        self.pt.classify_calls()
+        assert self.pt._module_named("late_mod") is late
+
+
 # =============================================================================
 # Variable tracking (kept for `obj%binding()` receiver types and signatures)
 # =============================================================================
 
 class TestVariableParsing:
 
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        ptree_path = F90_DIR / "test_interface_rank_ptree"
-        assert ptree_path.exists(), f"Parse tree not found: {ptree_path}"
-        self.pt, self.nr = parse_all_passes(ptree_path)
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def setup(cls):
+        # one parse per class: its tests only read the tree
+        cls.pt, cls.nr = parse_all_passes(F90_DIR / "test_interface_rank_ptree", decls_only=True)
 
     def test_scalar_variable(self):
         mod = get_module(self.nr, "caller_rank_mod")
@@ -243,15 +422,16 @@ class TestVariableParsing:
         mod = get_module(nr, "tbp_caller_mod")
         scope_key = Subroutine.key("test_type_bound_calls", mod)
         assert pt.variables[scope_key]["obj"].type == "derived:gadget_t"
+        assert pt.variables[scope_key]["obj"].derived_type_name == "gadget_t"
 
 
 class TestAssumedShapeVariables:
 
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        ptree_path = F90_DIR / "test_assumed_shape_ptree"
-        assert ptree_path.exists(), f"Parse tree not found: {ptree_path}"
-        self.pt, self.nr = parse_all_passes(ptree_path)
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def setup(cls):
+        # one parse per class: its tests only read the tree
+        cls.pt, cls.nr = parse_all_passes(F90_DIR / "test_assumed_shape_ptree", decls_only=True)
 
     def test_assumed_shape_rank_1d(self):
         mod = get_module(self.nr, "caller_assumed_mod")
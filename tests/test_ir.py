@@ -10,7 +10,7 @@ import pytest
 from pathlib import Path
 
 from groundline.frontend import FlangDumpFrontend
-from groundline.ir import INTERFACE
+from groundline.ir import FUNCTION, INTERFACE, SUBROUTINE
 
 
 F90_DIR = Path(__file__).parent / "f90"
@@ -23,25 +23,24 @@ def extract(fixture):
     return FlangDumpFrontend().extract([path])
 
 
+def get_entity(ir, kind, mod, name):
+    """Look an entity up by its scope-qualified EntityId (``mod::name``)."""
+    e = ir.get(f"{mod}::{name}")
+    if e is None or e.kind != kind:
+        raise ValueError(f"{kind.capitalize()} '{name}' not found in module '{mod}'")
+    return e
+
+
 def get_interface(ir, mod, name):
-    for i in ir.interfaces:
-        if i.name == name and i.scope == mod:
-            return i
-    raise ValueError(f"Interface '{name}' not found in module '{mod}'")
+    return get_entity(ir, INTERFACE, mod, name)
 
 
 def get_subroutine(ir, mod, name):
-    for s in ir.subroutines:
-        if s.name == name and s.scope == mod:
-            return s
-    raise ValueError(f"Subroutine '{name}' not found in module '{mod}'")
+    return get_entity(ir, SUBROUTINE, mod, name)
 
 
 def get_function(ir, mod, name):
-    for f in ir.functions:
-        if f.name == name and f.scope == mod:
-            return f
-    raise ValueError(f"Function '{name}' not found in module '{mod}'")
+    return get_entity(ir, FUNCTION, mod, name)
 
 
 def member_names(ir, iface):